@@ -15,11 +15,11 @@ it will assemble and append to the parent context variable (if any).
 """
 
 from .opsladder import OptionsLadder, OptionsBase, options_filter
-from .assemblable import Assemblable, AssembleList
+from .assemblable import Assemblable, AssembleList, map_items
 from .llatex import DocumentPart, NewCommand, Environment, LatexList
 
 __all__ = [
     "OptionsLadder", "OptionsBase", "options_filter",
-    "Assemblable", "AssembleList",
+    "Assemblable", "AssembleList", "map_items",
     "DocumentPart", "NewCommand", "Environment", "LatexList",
 ]
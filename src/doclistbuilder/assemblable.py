@@ -21,21 +21,24 @@ When the context manager is closed, the pipeline is run over the list, and the r
 appended to the parent list.
 """
 
-from types import TracebackType
-from typing import (Self, Type, Callable, NotRequired, Unpack, Any)
-from collections import ChainMap
+from types import MappingProxyType, TracebackType
+from typing import (Self, Type, Callable, ClassVar, Iterable, NotRequired, Sequence, Unpack, Any)
 
 from .opsladder import OptionsLadder, OptionsBase
 
 
 class AssembleList(list[str]):
     """A wrapper class for a list with some additional functions."""
+    __slots__ = ('_context', '__weakref__')
+
     def __init__(
         self: Self,
-        init: list[str] | None = None,
+        init: Iterable[str] | None = None,
         context: 'Assemblable | None' = None,
     ) -> None:
-        super().__init__(init or [])
+        # A new list is already empty, so only initialise when given items.
+        if init:
+            super().__init__(init)
         self._context: 'Assemblable | None' = context
 
     def __repr__(self) -> str:
@@ -49,27 +52,36 @@ class AssembleList(list[str]):
 
 class Assemblable(OptionsLadder.HasOptions, metaclass=OptionsLadder):
     """Base class for assemblable objects."""
+    __slots__ = ('settings', '_result', '_parent', 'data', '__weakref__')
+
     class Options(OptionsBase):
         """Options for assemblable objects."""
         list_type: NotRequired[Type[AssembleList]]
-        "The type of assemblable list to use."
+        """
+        The type of assemblable list to use. A closed child context adds a
+        single item result to it with `append`, and any other result with
+        `extend`.
+        """
 
-        pipeline: NotRequired[list[Callable[[list[str]], list[str]]]]
+        pipeline: NotRequired[Sequence[Callable[[list[str]], list[str]]]]
         """
         The pipeline of functions to fold over the list when the context
         is closed.
         """
 
-        initial_list: NotRequired[list[str]]
+        initial_list: NotRequired[Iterable[str]]
         "Initialize the assemblable list with this list."
 
     _defaults: Options = {  # type: ignore[assignment]
         "list_type": AssembleList,
-        "initial_list": [],
-        "pipeline": [],
+        # Tuples, so instances sharing these defaults cannot mutate them.
+        "initial_list": (),
+        "pipeline": (),
     }
 
-    settings: ChainMap[str, Any]
+    _class_settings: ClassVar[MappingProxyType[str, Any]]
+    _option_keys: ClassVar[frozenset[str]]
+    settings: dict[str, Any]
 
     def __init__(
         self,
@@ -77,8 +89,11 @@ class Assemblable(OptionsLadder.HasOptions, metaclass=OptionsLadder):
         **kwargs: Unpack[Options]
     ) -> None:
 
-        self.settings = ChainMap({}, self.settings)
-        self.settings.update(kwargs.items())  # Drop typing.
+        # Resolve the options once, so later reads are single dict lookups.
+        # copy() of the read-only class settings is a fast dict copy, where
+        # ** unpacking would go through the generic mapping protocol.
+        self.settings = self._class_settings.copy()
+        self.settings.update(kwargs)
 
         self._result: list[str] | None = None
         self._parent = parent
@@ -95,10 +110,20 @@ class Assemblable(OptionsLadder.HasOptions, metaclass=OptionsLadder):
         exc_value: BaseException | None,
         exc_traceback: TracebackType | None,
     ) -> None:
-        self._result = self.run_pipeline(self.data)
-
-        if self._parent is not None:
-            self._parent.extend(self._result)
+        # Pass-through scopes have no pipeline; skip the call entirely.
+        if self.settings['pipeline']:
+            result = self._result = self.run_pipeline(self.data)
+        else:
+            result = self._result = self.data
+
+        parent = self._parent
+        if parent is not None:
+            # Assembled parts usually fold down to a single item. Pipelines
+            # may also return any iterable, which extend still accepts.
+            if isinstance(result, list) and len(result) == 1:
+                parent.append(result[0])
+            else:
+                parent.extend(result)
 
         return None
 
@@ -122,3 +147,23 @@ class Assemblable(OptionsLadder.HasOptions, metaclass=OptionsLadder):
     def parent(self: Self) -> AssembleList | None:
         """Return the parent context manager."""
         return self._parent
+
+
+def map_items(*funcs: Callable[[str], str]) -> Callable[[list[str]], list[str]]:
+    """Return a pipeline function applying `funcs`, in order, to every item.
+
+    The functions are fused into a single pass over the list, instead of
+    building a new list for each per-item pipeline step.
+    """
+    if len(funcs) == 1:
+        apply = funcs[0]
+    else:
+        def apply(item: str) -> str:
+            for func in funcs:
+                item = func(item)
+            return item
+
+    def p_map(data: list[str]) -> list[str]:
+        return list(map(apply, data))
+
+    return p_map
@@ -23,16 +23,20 @@ Example:
     ```
 """
 
-from typing import Self, NotRequired, Unpack
+from typing import Self, NotRequired, Unpack, TextIO
+import functools
 import re
-from collections import ChainMap
 
 from .assemblable import AssembleList, Assemblable
 from .opsladder import options_filter
 
+_CONTROL_WORD_MATCH = re.compile(r'[a-zA-Z][a-zA-Z@*:]*').fullmatch
+_ENVIRONMENT_NAME_MATCH = re.compile(r'[a-zA-Z][a-zA-Z0-9@*]*').fullmatch
+
 
 class LatexList(AssembleList):
     """Helper functions for LaTeX document lists."""
+    __slots__ = ()
 
     def desc_item(self: Self, key: str, value: str) -> None:
         """Append a description-like item."""
@@ -49,6 +53,8 @@ class LatexList(AssembleList):
 
 class DocumentPart(Assemblable):
     """Base class for document parts."""
+    __slots__ = ()
+
     class Options(Assemblable.Options):
         """Options for document parts."""
         name: NotRequired[str | None]
@@ -63,12 +69,21 @@ class DocumentPart(Assemblable):
         delimiter: NotRequired[str]
         "The delimiter string to join the list with."
 
+        sink: NotRequired[TextIO | None]
+        """
+        Optional text stream (e.g. an open file) to write the assembled part
+        to, instead of returning it. The result is then `[]` and the parent
+        (if any) receives nothing, so this is intended for the outermost
+        part of a large document. Cannot be combined with a pipeline.
+        """
+
     _defaults: Options = {  # type: ignore[assignment]
         "list_type": LatexList,
         "name": None,
         "prolog": "",
         "epilog": "",
-        "delimiter": "\n"
+        "delimiter": "\n",
+        "sink": None,
     }
 
     def __init__(
@@ -78,11 +93,19 @@ class DocumentPart(Assemblable):
     ) -> None:
         """Initialize a new DocumentPart context manager."""
 
-        self._defaults['pipeline'] = [self.p_join, self.p_wrap]
+        custom_pipeline = kwargs.get('pipeline')
+        kwargs.setdefault('pipeline', [self.p_assemble])
 
-        (up, down) = options_filter(kwargs, super().Options)
-        self.settings = ChainMap(down, self.settings)
+        (up, down) = options_filter(kwargs, super()._option_keys)
         super().__init__(parent, **up)
+        self.settings.update(down)
+
+        # The sink may come from kwargs or class defaults, so check the
+        # resolved settings.
+        if self.settings['sink'] is not None:
+            if custom_pipeline:
+                raise ValueError("A sink cannot be combined with a pipeline")
+            self.settings['pipeline'] = [self.p_write]
 
     @property
     def name(self: Self) -> str | None:
@@ -97,6 +120,37 @@ class DocumentPart(Assemblable):
         """Wrap a list with the set prefix and suffix."""
         return (["".join([self.settings['prolog']] + data + [self.settings['epilog']])])
 
+    def p_assemble(self: Self, data: list[str]) -> list[str]:
+        """Join a list with the set delimiter and wrap it with the prefix and suffix.
+
+        Equivalent to `p_join` followed by `p_wrap`, but builds the string
+        in one pass without the intermediate lists.
+        """
+        settings = self.settings
+        # Empty and single item parts are common; skip the join for them.
+        if not data:
+            return [settings['prolog'] + settings['epilog']]
+        if len(data) == 1:
+            return [settings['prolog'] + data[0] + settings['epilog']]
+        return [f"{settings['prolog']}{settings['delimiter'].join(data)}{settings['epilog']}"]
+
+    def p_write(self: Self, data: list[str]) -> list[str]:
+        """Write the list, as `p_assemble` would build it, to the set sink.
+
+        The pieces are written one by one, so the whole part is never held
+        as a single string. Nothing is left for the result.
+        """
+        settings = self.settings
+        write = settings['sink'].write
+        delimiter = settings['delimiter']
+        write(settings['prolog'])
+        for i, item in enumerate(data):
+            if i:
+                write(delimiter)
+            write(item)
+        write(settings['epilog'])
+        return []
+
 
 def validate_latex_control_word(name: str) -> None:
     """Validate that a string is a valid LaTeX command name.
@@ -112,7 +166,8 @@ def validate_latex_control_word(name: str) -> None:
     if not name:
         raise ValueError("Command name cannot be empty")
 
-    if not re.fullmatch(r'[a-zA-Z][a-zA-Z@*:]*', name):
+    # Plain ASCII letter names are the common case; check them without the regex.
+    if not (name.isascii() and name.isalpha()) and not _CONTROL_WORD_MATCH(name):
         raise ValueError(
             f"Invalid command name: {name!r}. Must start with a letter and "
             "contain only letters, @, *, or :"
@@ -131,15 +186,28 @@ def validate_environment_name(name: str) -> None:
     if not name:
         raise ValueError("Environment name cannot be empty")
 
-    if not re.fullmatch(r'[a-zA-Z][a-zA-Z0-9@*]*', name):
+    if not (name.isascii() and name.isalpha()) and not _ENVIRONMENT_NAME_MATCH(name):
         raise ValueError(
             f"Invalid environment name: {name!r}. Must start with a letter "
             "and contain only letters, numbers, @, or *"
         )
 
 
+# Documents tend to repeat the same environments, so their prologs are
+# memoized on the values that shape them.
+@functools.lru_cache(maxsize=512)
+def _environment_prolog(name: str, ops: str | None, args: str | None) -> str:
+    return (
+        rf"\begin{{{name}}}"
+        + (f"[{ops}]" if ops else "")
+        + (f"{{{args}}}" if args else "")
+        + "%\n"
+    )
+
+
 class NewCommand(DocumentPart):
     r"NewCommand like document components of the form \newcommand{name}{...}."
+    __slots__ = ()
 
     class Options(DocumentPart.Options):
         """Available options for NewCommand."""
@@ -164,16 +232,16 @@ class NewCommand(DocumentPart):
     ) -> None:
 
         kwargs['name'] = cmd_name
-        self.validate_and_update(**(self._defaults | kwargs))
+        kwargs = self.validate_and_update(**(self._defaults | kwargs)) | kwargs
 
-        (up, down) = options_filter(kwargs, super().Options)
-        self.settings = ChainMap(down, self.settings)
+        (up, down) = options_filter(kwargs, super()._option_keys)
         super().__init__(parent, **up)
+        self.settings.update(down)
 
-    def validate_and_update(self, *, name, nargs, default, **_) -> None:
+    def validate_and_update(self, *, name, nargs, default, **_) -> Options:
         """
-        Validate and update the default settings, for this
-        NewCommand context manager.
+        Validate the settings for this NewCommand context manager and
+        return the default settings derived from them.
         """
 
         validate_latex_control_word(name)
@@ -181,16 +249,20 @@ class NewCommand(DocumentPart):
         if nargs < 0 or nargs > 9:
             raise ValueError(f"nargs must be between 0 and 9, got {nargs}")
 
-        self._defaults['prolog'] = (
-            f"\\newcommand{{\\{name}}}"
-            + (f"[{nargs}]" if nargs > 0 else "")
-            + (f"[{default}]" if default is not None else "")
-            + "{%\n"
-        )
+        return {
+            "prolog": (
+                f"\\newcommand{{\\{name}}}"
+                + (f"[{nargs}]" if nargs > 0 else "")
+                + (f"[{default}]" if default is not None else "")
+                + "{%\n"
+            ),
+        }
 
 
 class Environment(DocumentPart):
     r"Environment like document components of the form \begin{name} ... \end{name}."
+    __slots__ = ()
+
     class Options(DocumentPart.Options):
         """Available options for Environment."""
         args: NotRequired[str | None]
@@ -213,23 +285,19 @@ class Environment(DocumentPart):
     ) -> None:
 
         kwargs['name'] = env_name
+        kwargs = self.validate_and_update(**(self._defaults | kwargs)) | kwargs
 
-        self.validate_and_update(**(self._defaults | kwargs))
-
-        (up, down) = options_filter(kwargs, super().Options)
-        self.settings = ChainMap(down, self.settings)
+        (up, down) = options_filter(kwargs, super()._option_keys)
         super().__init__(parent, **up)
+        self.settings.update(down)
 
-    def validate_and_update(self, *, name, args, ops, **_) -> None:
+    def validate_and_update(self, *, name, args, ops, **_) -> Options:
         """
-        Validate and update the default settings, for this Environment
-        context manager.
+        Validate the settings for this Environment context manager and
+        return the default settings derived from them.
         """
         validate_environment_name(name)
-        self._defaults['prolog'] = (
-            rf"\begin{{{name}}}"
-            + (f"[{ops}]" if ops else "")
-            + (f"{{{args}}}" if args else "")
-            + "%\n"
-        )
-        self._defaults['epilog'] = f"\n\\end{{{name}}}%"
+        return {
+            "prolog": _environment_prolog(name, ops, args),
+            "epilog": f"\n\\end{{{name}}}%",
+        }
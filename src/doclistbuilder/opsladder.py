@@ -18,8 +18,8 @@ Example:
     ```
 """
 
-from typing import TypedDict, Any
-from collections import ChainMap
+from types import MappingProxyType
+from typing import TypedDict, Any, Collection
 
 
 class OptionsLadder(type):
@@ -27,8 +27,10 @@ class OptionsLadder(type):
 
     class HasOptions():  # pylint: disable=too-few-public-methods
         """Marker for classes with options."""
+        __slots__ = ()
 
-    settings: ChainMap[str, Any]
+    _class_settings: MappingProxyType[str, Any]
+    _option_keys: frozenset[str]
 
     def __new__(
         mcs,
@@ -38,12 +40,23 @@ class OptionsLadder(type):
     ):
         n_cls = super().__new__(mcs, cname, bases, namespace)
 
-        d: ChainMap[str, Any] = ChainMap()
+        # Class defaults are shared by every instance, so make them read-only;
+        # per-instance values belong in the instance settings.
+        if '_defaults' in namespace:
+            n_cls._defaults = MappingProxyType(dict(namespace['_defaults']))
+
+        # Flatten the defaults of the hierarchy into one read-only dict, the
+        # most derived class winning, so a settings read is a single lookup.
+        d: dict[str, Any] = {}
         for c in reversed(n_cls.mro()):
-            if issubclass(c, OptionsLadder.HasOptions) and hasattr(c, '_defaults'):
-                d = ChainMap(getattr(c, "_defaults"), d)
+            if issubclass(c, OptionsLadder.HasOptions) and '_defaults' in c.__dict__:
+                d.update(c.__dict__['_defaults'])
+
+        n_cls._class_settings = MappingProxyType(d)
 
-        n_cls.settings = d
+        # Cache the option names of the class, for options_filter.
+        if 'Options' in namespace:
+            n_cls._option_keys = frozenset(namespace['Options'].__annotations__)
 
         return n_cls
 
@@ -54,10 +67,16 @@ class OptionsBase(TypedDict):
 
 def options_filter(
     x: OptionsBase,
-    s: object
+    s: type | Collection[str]
 ) -> tuple[dict[str, Any], dict[str, Any]]:
-    """Filter options based on the type annotations of the given class."""
-    return (
-        {k: v for k, v in x.items() if k in s.__annotations__},
-        {k: v for k, v in x.items() if k not in s.__annotations__},
-    )
+    """Filter options based on the type annotations of the given class.
+
+    `s` is either an options class (TypedDict), or a collection of option
+    names such as the `_option_keys` cached by `OptionsLadder`.
+    """
+    keys = s.__annotations__ if isinstance(s, type) else s
+    up: dict[str, Any] = {}
+    down: dict[str, Any] = {}
+    for k, v in x.items():
+        (up if k in keys else down)[k] = v
+    return (up, down)
@@ -0,0 +1,121 @@
+"""Tests for the Assemblable framework."""
+import weakref
+
+import pytest
+
+from doclistbuilder import (
+    Assemblable, AssembleList, DocumentPart, Environment, NewCommand, LatexList, map_items,
+)
+
+
+def test_instances_have_no_dict() -> None:
+    """The list and part classes use __slots__ instead of a __dict__."""
+    for obj in (
+        AssembleList(), LatexList(), Assemblable(), DocumentPart(),
+        Environment(None, 'itemize'), NewCommand(None, 'foo'),
+    ):
+        assert not hasattr(obj, '__dict__')
+
+
+def test_instances_support_weak_references() -> None:
+    """The list and part classes can still be weakly referenced."""
+    for obj in (
+        AssembleList(), LatexList(), Assemblable(), DocumentPart(),
+        Environment(None, 'itemize'), NewCommand(None, 'foo'),
+    ):
+        assert weakref.ref(obj)() is obj
+
+
+class RecordingList(AssembleList):
+    """A list type that records how items were added."""
+    __slots__ = ('calls',)
+
+    def __init__(self, init=None, context=None) -> None:
+        super().__init__(init, context)
+        self.calls: list[str] = []
+
+    def append(self, item) -> None:
+        self.calls.append('append')
+        super().append(item)
+
+    def extend(self, items) -> None:
+        self.calls.append('extend')
+        super().extend(items)
+
+
+def test_single_item_result_is_appended() -> None:
+    """A single item result goes to the parent through append."""
+    root = Assemblable(list_type=RecordingList)
+    with root as items:
+        with DocumentPart(items) as part:
+            part.extend(["a", "b"])
+    assert list(items) == ["a\nb"]
+    assert items.calls == ['append']
+
+
+def test_other_results_are_extended() -> None:
+    """Multi-item and iterator results go to the parent through extend."""
+    root = Assemblable(list_type=RecordingList)
+    with root as items:
+        with Assemblable(items) as inner:
+            inner.extend(["a", "b"])
+        with Assemblable(items, pipeline=[lambda data: (s.upper() for s in data)]) as inner:
+            inner.append("q")
+    assert list(items) == ["a", "b", "Q"]
+    assert items.calls == ['extend', 'extend']
+
+
+def test_result_before_close_raises() -> None:
+    """Reading the result of an open context is an error."""
+    with pytest.raises(ValueError):
+        _ = Assemblable().result
+
+
+def test_map_items_single_function() -> None:
+    """A single function is applied to every item."""
+    assert map_items(str.upper)(["a", "b"]) == ["A", "B"]
+
+
+def test_map_items_applies_functions_in_order() -> None:
+    """Several functions are applied to each item in the given order."""
+    stage = map_items(str.upper, lambda s: s + "!", lambda s: "<" + s)
+    assert stage(["a", "b"]) == ["<A!", "<B!"]
+
+
+def test_map_items_without_functions() -> None:
+    """With no functions the items are returned unchanged, in a new list."""
+    data = ["a", "b"]
+    result = map_items()(data)
+    assert result == data
+    assert result is not data
+
+
+def test_map_items_in_pipeline() -> None:
+    """map_items stages run as part of a pipeline."""
+    part = Assemblable(pipeline=[map_items(str.strip, str.upper)])
+    with part as p:
+        p.extend([" a ", "b "])
+    assert part.result == ["A", "B"]
+
+
+def test_empty_pipeline_passes_data_through() -> None:
+    """Without a pipeline the result is the context's own list."""
+    part = Assemblable()
+    with part as items:
+        items.append("a")
+    assert part.result is items
+
+
+def test_list_initialisation(sample_list) -> None:
+    """Lists start empty or from the given items, including iterators."""
+    assert list(AssembleList()) == []
+    assert list(AssembleList(iter(["a", "b"]))) == ["a", "b"]
+    assert list(sample_list) == ["item1", "item2", "item3"]
+
+
+def test_list_context(empty_list) -> None:
+    """The list knows the context that created it."""
+    part = Assemblable(empty_list)
+    assert part.parent is empty_list
+    assert part.data.context is part
+    assert empty_list.context is None
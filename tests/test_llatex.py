@@ -0,0 +1,179 @@
+"""Tests for the LaTeX document parts."""
+import io
+
+import pytest
+
+from doclistbuilder import DocumentPart, NewCommand, Environment
+from doclistbuilder.llatex import validate_latex_control_word, validate_environment_name
+
+
+def test_custom_delimiter() -> None:
+    """Items are joined with the set delimiter and wrapped."""
+    part = DocumentPart(prolog='(', epilog=')', delimiter=',')
+    with part as p:
+        p.extend(["1", "2", "3"])
+    assert part.result == ["(1,2,3)"]
+
+
+def test_latex_list_helpers() -> None:
+    """desc_item and rule append LaTeX snippets."""
+    part = DocumentPart()
+    with part as p:
+        p.desc_item("k", "v")
+        p.rule()
+    assert part.result == ["\\item [{k}] v\n\\rule{\\textwidth}{0.4pt}"]
+
+
+def test_p_assemble_matches_join_and_wrap() -> None:
+    """The fused stage gives the same result as p_join then p_wrap."""
+    part = DocumentPart(prolog='<', epilog='>', delimiter='|')
+    data = ["a", "b", "c"]
+    assert part.p_assemble(data) == part.p_wrap(part.p_join(data))
+
+
+def test_command_and_environment_use_p_assemble() -> None:
+    """NewCommand and Environment are assembled by the default pipeline."""
+    cmd = NewCommand(None, 'foo', nargs=1)
+    with cmd as c:
+        c.extend(["a", "#1"])
+    assert cmd.result == ["\\newcommand{\\foo}[1]{%\na\n#1\n}%"]
+
+    env = Environment(None, 'itemize')
+    with env as e:
+        e.extend(["\\item a", "\\item b"])
+    assert env.result == ["\\begin{itemize}%\n\\item a\n\\item b\n\\end{itemize}%"]
+
+
+def test_invalid_names_are_rejected() -> None:
+    """Command and environment names are checked against their grammar."""
+    with pytest.raises(ValueError):
+        NewCommand(None, '1a')
+    with pytest.raises(ValueError):
+        NewCommand(None, 'a1')
+    with pytest.raises(ValueError):
+        Environment(None, 'a:b')
+    with pytest.raises(ValueError):
+        Environment(None, '')
+    with pytest.raises(ValueError):
+        Environment(None, 'é')
+    with pytest.raises(ValueError):
+        NewCommand(None, 'foo', nargs=10)
+    assert Environment(None, 'a1').name == 'a1'
+    assert NewCommand(None, 'a@:').name == 'a@:'
+
+
+def test_nested_parts_keep_their_own_prolog() -> None:
+    """Each nested part renders its own name, not the last sibling's."""
+    doc = DocumentPart()
+    with doc as d:
+        with NewCommand(d, 'outer') as outer:
+            with NewCommand(outer, 'inner') as inner:
+                inner.append("x")
+        with Environment(d, 'document') as body:
+            with Environment(body, 'center') as center:
+                center.append("y")
+
+    assert doc.result == [
+        "\\newcommand{\\outer}{%\n"
+        "\\newcommand{\\inner}{%\nx\n}%\n"
+        "}%\n"
+        "\\begin{document}%\n"
+        "\\begin{center}%\ny\n\\end{center}%\n"
+        "\\end{document}%"
+    ]
+
+
+def test_part_names() -> None:
+    """Nested parts report their own names."""
+    with Environment(None, 'document') as body:
+        inner = Environment(body, 'center')
+    assert body.context is not None
+    assert body.context.name == 'document'
+    assert inner.name == 'center'
+
+
+def test_explicit_prolog_overrides_derived() -> None:
+    """An explicit prolog or epilog wins over the derived one."""
+    env = Environment(None, 'itemize', prolog='<', epilog='>')
+    with env as e:
+        e.append("a")
+    assert env.result == ["<a>"]
+
+    cmd = NewCommand(None, 'foo', prolog='[')
+    with cmd as c:
+        c.append("b")
+    assert cmd.result == ["[b\n}%"]
+
+
+@pytest.mark.parametrize("name", ["foo", "a@b", "a*", "a:b"])
+def test_valid_control_words(name: str) -> None:
+    """Letters take the fast path; @, * and : go through the regex."""
+    validate_latex_control_word(name)
+
+
+@pytest.mark.parametrize("name", ["", "a1", "1a", "é", "aé", "a b"])
+def test_invalid_control_words(name: str) -> None:
+    """Digits, leading non-letters and non-ASCII letters are rejected."""
+    with pytest.raises(ValueError):
+        validate_latex_control_word(name)
+
+
+@pytest.mark.parametrize("name", ["itemize", "a@b", "a1", "a*"])
+def test_valid_environment_names(name: str) -> None:
+    """Letters take the fast path; digits, @ and * go through the regex."""
+    validate_environment_name(name)
+
+
+@pytest.mark.parametrize("name", ["", "1a", "é", "a:b", "a b"])
+def test_invalid_environment_names(name: str) -> None:
+    """Leading digits, non-ASCII letters and : are rejected."""
+    with pytest.raises(ValueError):
+        validate_environment_name(name)
+
+
+def test_empty_and_single_item_parts() -> None:
+    """Empty and single item parts are wrapped without a join."""
+    part = DocumentPart(prolog='<', epilog='>', delimiter=',')
+    assert part.p_assemble([]) == ["<>"]
+    assert part.p_assemble(["a"]) == ["<a>"]
+    assert part.p_assemble(["a", "b"]) == ["<a,b>"]
+
+
+def test_newcommand_prolog_shapes() -> None:
+    """Arguments and defaults are rendered into the prolog."""
+    cmd = NewCommand(None, 'foo', nargs=2, default='d')
+    with cmd as c:
+        c.append("#1")
+    assert cmd.result == ["\\newcommand{\\foo}[2][d]{%\n#1\n}%"]
+
+
+def test_environment_prolog_shapes() -> None:
+    """Options and arguments are rendered into the prolog."""
+    env = Environment(None, 'tabular', ops='t', args='ll')
+    with env:
+        pass
+    assert env.result == ["\\begin{tabular}[t]{ll}%\n\n\\end{tabular}%"]
+
+
+def test_environment_prologs_are_reused() -> None:
+    """Repeated environments share one memoized prolog string."""
+    first = Environment(None, 'itemize', ops='a')
+    second = Environment(None, 'itemize', ops='a')
+    assert first.settings['prolog'] == "\\begin{itemize}[a]%\n"
+    assert first.settings['prolog'] is second.settings['prolog']
+
+
+def test_sink_receives_output() -> None:
+    """With a sink the part is written to it and nothing is returned."""
+    sink = io.StringIO()
+    part = DocumentPart(sink=sink, prolog='P', epilog='E', delimiter=',')
+    with part as p:
+        p.extend(["a", "b"])
+    assert part.result == []
+    assert sink.getvalue() == "Pa,bE"
+
+
+def test_sink_rejects_pipeline() -> None:
+    """A sink cannot be combined with a custom pipeline."""
+    with pytest.raises(ValueError):
+        DocumentPart(sink=io.StringIO(), pipeline=[list])
@@ -0,0 +1,91 @@
+"""Tests for the OptionsLadder metaclass and options_filter."""
+from types import MappingProxyType
+
+import pytest
+
+from doclistbuilder import Assemblable, DocumentPart, NewCommand, Environment, options_filter
+
+
+def test_class_settings_merge_hierarchy() -> None:
+    """Class defaults are flattened, the most derived class winning."""
+    assert isinstance(NewCommand._class_settings, MappingProxyType)
+    assert NewCommand._class_settings['epilog'] == "\n}%"
+    assert DocumentPart._class_settings['epilog'] == ""
+    assert NewCommand._class_settings['nargs'] == 0
+    assert NewCommand._class_settings['list_type'] is DocumentPart._class_settings['list_type']
+
+
+def test_options_filter_with_options_class() -> None:
+    """Options are split on the keys of an options TypedDict."""
+    up, down = options_filter({'name': 'x', 'nargs': 1}, DocumentPart.Options)
+    assert up == {'name': 'x'}
+    assert down == {'nargs': 1}
+
+
+def test_class_defaults_are_read_only() -> None:
+    """Writing to a class-level _defaults raises."""
+    with pytest.raises(TypeError):
+        Environment._defaults['prolog'] = "x"  # type: ignore[index]
+
+
+def test_instances_leave_class_settings_untouched() -> None:
+    """Building instances does not leak into the shared class settings."""
+    before = dict(NewCommand._class_settings)
+    defaults = dict(NewCommand._defaults)
+
+    with NewCommand(None, 'foo', nargs=2, prolog="P") as cmd:
+        cmd.append("#1")
+    Environment(None, 'itemize')
+
+    assert dict(NewCommand._class_settings) == before
+    assert dict(NewCommand._defaults) == defaults
+    assert 'prolog' not in NewCommand._defaults
+
+
+def test_class_settings_are_read_only() -> None:
+    """The merged class settings cannot be written."""
+    with pytest.raises(TypeError):
+        DocumentPart._class_settings['prolog'] = "x"  # type: ignore[index]
+
+
+def test_option_keys_are_cached_per_class() -> None:
+    """Each class with an Options TypedDict caches its option names."""
+    assert DocumentPart._option_keys == frozenset(DocumentPart.Options.__annotations__)
+    assert 'nargs' in NewCommand._option_keys
+    assert 'nargs' not in DocumentPart._option_keys
+
+
+def test_options_filter_with_option_keys() -> None:
+    """Options are split on a cached set of option names."""
+    up, down = options_filter({'name': 'x', 'nargs': 1}, DocumentPart._option_keys)
+    assert up == {'name': 'x'}
+    assert down == {'nargs': 1}
+
+
+def test_option_keys_exclude_class_annotations() -> None:
+    """Only Options keys are option names, not class-body annotations."""
+    assert 'settings' not in DocumentPart._option_keys
+    assert '_class_settings' not in DocumentPart._option_keys
+    assert 'nargs' in NewCommand._option_keys
+
+
+def test_instances_do_not_share_mutable_defaults() -> None:
+    """Default pipeline and initial list are immutable, so cannot leak."""
+    part = Assemblable()
+    with pytest.raises(AttributeError):
+        part.settings['pipeline'].append(str.upper)
+    with pytest.raises(AttributeError):
+        part.settings['initial_list'].append("a")
+    with part as items:
+        items.append("a")
+    assert Assemblable().settings['pipeline'] == ()
+    assert list(Assemblable().data) == []
+
+
+def test_initial_list_option_reaches_result(sample_list) -> None:
+    """Given initial items are kept, and closed children are added after them."""
+    root = Assemblable(initial_list=sample_list)
+    with root as items:
+        with Assemblable(items) as more:
+            more.extend(["d", "e"])
+    assert list(root.result or []) == ["item1", "item2", "item3", "d", "e"]